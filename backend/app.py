@@ -11,4 +11,4 @@ def index():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5100)
+    app.run(debug=True, port=5100, threaded=True)  # 多线程处理请求，避免慢 adb 调用阻塞其他接口